@@ -1,6 +1,6 @@
-import { createClient } from '@supabase/supabase-js'
 import { cookies } from 'next/headers'
 import { NextResponse } from 'next/server'
+import { createClient } from '@/lib/supabase/server'
 
 export async function POST() {
   const cookieStore = await cookies()
@@ -11,21 +11,10 @@ export async function POST() {
   cookieStore.delete('sb-auth-token')
   
   // Create Supabase client
-  const supabase = createClient(
-    process.env.NEXT_PUBLIC_SUPABASE_URL!,
-    process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
-    {
-      global: {
-        fetch: fetch.bind(globalThis)
-      },
-      auth: {
-        persistSession: false
-      }
-    }
-  )
+  const supabase = await createClient()
   
   // Sign out on the server side
   await supabase.auth.signOut()
   
   return NextResponse.json({ success: true })
-} 
\ No newline at end of file
+}
@@ -1,8 +1,21 @@
 // File: frontend/app/api/v1/speech/transcribe/route.ts
 import { NextRequest, NextResponse } from 'next/server';
-import { mockAPI } from '@/mocks/mockData';
+import { mockAPI, USE_MOCK_TRANSCRIPTION } from '@/mocks/mockData';
+
+// Upper bound for an upload; a 30 second recording is a small fraction of this
+const MAX_AUDIO_BYTES = 10 * 1024 * 1024; // 10 MB
 
 export async function POST(request: NextRequest) {
+    if (!USE_MOCK_TRANSCRIPTION) {
+        return NextResponse.json({ error: "Transcription service is not configured." }, { status: 503 });
+    }
+
+    // Reject oversized uploads from the declared length before buffering the body
+    const contentLength = Number(request.headers.get('content-length'));
+    if (contentLength > MAX_AUDIO_BYTES) {
+        return NextResponse.json({ error: "Audio file is too large." }, { status: 413 });
+    }
+
     try {
         const formData = await request.formData();
         const file = formData.get('file') as File | null;
@@ -11,6 +24,14 @@ export async function POST(request: NextRequest) {
             return NextResponse.json({ error: "No audio file provided." }, { status: 400 });
         }
 
+        if (file.size > MAX_AUDIO_BYTES) {
+            return NextResponse.json({ error: "Audio file is too large." }, { status: 413 });
+        }
+
+        if (!file.type.startsWith('audio/')) {
+            return NextResponse.json({ error: "Uploaded file is not audio." }, { status: 415 });
+        }
+
         console.log(`[API Route] Received audio file: ${file.name}, size: ${file.size}, type: ${file.type}`);
 
         // Use mock transcription instead of OpenAI
@@ -2,6 +2,7 @@ import { createClient } from '@supabase/supabase-js'
 import { cookies } from 'next/headers'
 import { NextResponse } from 'next/server'
 import type { NextRequest } from 'next/server'
+import { supabaseUrl, supabaseAnonKey } from '@/lib/supabase/config'
 
 export async function GET(request: NextRequest) {
   const requestUrl = new URL(request.url)
@@ -10,8 +11,8 @@ export async function GET(request: NextRequest) {
   if (code) {
     const cookieStore = await cookies()
     const supabase = createClient(
-      process.env.NEXT_PUBLIC_SUPABASE_URL!,
-      process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
+      supabaseUrl,
+      supabaseAnonKey,
       {
         global: {
           fetch: fetch.bind(globalThis)
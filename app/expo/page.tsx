@@ -11,7 +11,7 @@ import { Clock, CheckCircle, AlertCircle, ChefHat, Utensils } from "lucide-react
 import { ScrollArea } from "@/components/ui/scroll-area"
 import { Separator } from "@/components/ui/separator"
 import { motion, AnimatePresence } from "framer-motion"
-import { fetchRecentOrders, type Order, updateOrderStatus } from "@/lib/orders"
+import { fetchRecentOrders, type Order, updateOrderStatus, ORDER_STATUS_LABELS } from "@/lib/orders"
 
 export default function ExpoPage() {
   const [orders, setOrders] = useState<Order[]>([])
@@ -213,7 +213,7 @@ export default function ExpoPage() {
                         <div className="flex items-center gap-2">
                           <CardTitle>{order.table}</CardTitle>
                           <Badge variant="outline" className={`status-badge status-${order.status}`}>
-                            {order.status.charAt(0).toUpperCase() + order.status.slice(1).replace('_', ' ')}
+                            {ORDER_STATUS_LABELS[order.status]}
                           </Badge>
                         </div>
                         <CardDescription>
@@ -6,7 +6,7 @@ import { Badge } from "@/components/ui/badge";
 import { ScrollArea } from "@/components/ui/scroll-area";
 import { Clock } from "lucide-react";
 import { useToast } from "@/hooks/use-toast";
-import { fetchRecentOrders, type Order } from "@/lib/orders";
+import { fetchRecentOrders, ORDER_STATUS_LABELS, type Order } from "@/lib/orders";
 
 export default function KitchenPage() {
   const [orders, setOrders] = useState<Order[]>([]);
@@ -61,7 +61,7 @@ export default function KitchenPage() {
                   </div>
                   <div className="text-right">
                     <Badge variant="outline" className={`status-badge status-${order.status}`}>
-                      {order.status.charAt(0).toUpperCase() + order.status.slice(1).replace('_', ' ')}
+                      {ORDER_STATUS_LABELS[order.status]}
                     </Badge>
                     <div className="text-xs text-gray-400 flex items-center gap-1 mt-1">
                       <Clock className="h-4 w-4" />
@@ -16,7 +16,7 @@ import { motion, AnimatePresence } from "framer-motion"
 import { Table } from "@/lib/floor-plan-utils"
 import { fetchTables } from "@/lib/tables"
 import { useAuth } from "@/lib/AuthContext"
-import { fetchRecentOrders, createOrder, type Order } from "@/lib/orders"
+import { fetchRecentOrders, createOrder, splitOrderItems, ORDER_STATUS_LABELS, type Order } from "@/lib/orders"
 import { fetchSeatId } from "@/lib/seats"
 import { getAllResidents, type User as Resident } from "@/lib/users"
 import { getOrderSuggestions } from "@/lib/suggestions"
@@ -174,6 +174,13 @@ export default function ServerPage() {
       return;
     }
 
+    // Nothing to send for an empty transcript, so skip the seat lookup and insert entirely
+    const items = selectedSuggestion ? selectedSuggestion.items : splitOrderItems(orderText);
+    if (items.length === 0) {
+      toast({ title: "Error", description: "No order items were recognized.", variant: "destructive" });
+      return;
+    }
+
     // Get the seat ID using the fetchSeatId function
     const seatId = await fetchSeatId(selectedTable.id, selectedSeat);
     
@@ -188,9 +195,7 @@ export default function ServerPage() {
         seat_id: seatId,
         resident_id: selectedResident,
         server_id: user.id,
-        items: selectedSuggestion 
-          ? selectedSuggestion.items
-          : orderText.split(",").map(item => item.trim()).filter(item => item),
+        items,
         transcript: selectedSuggestion ? orderText : orderText,
         type: orderType || 'food'
       };
@@ -504,7 +509,7 @@ export default function ServerPage() {
                               <div className="flex justify-between items-center mb-2">
                                 <div className="font-medium text-white">Table {order.table} {order.seat ? `(Seat ${order.seat})` : ''}</div>
                                 <Badge variant="outline" className={`status-badge status-${order.status}`}>
-                                  {order.status.charAt(0).toUpperCase() + order.status.slice(1).replace('_', ' ')}
+                                  {ORDER_STATUS_LABELS[order.status]}
                                 </Badge>
                               </div>
                               <div className="space-y-1 mb-2">
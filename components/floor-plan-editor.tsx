@@ -17,17 +17,27 @@ import { Slider } from "@/components/ui/slider"
 import { Switch } from "@/components/ui/switch"
 import { Badge } from "@/components/ui/badge"
 import { Card, CardContent } from "@/components/ui/card"
-import { cn } from "@/lib/utils"
+import { cn, createLogger } from "@/lib/utils"
 import {
   Table, BackendTable, TableCreatePayload, TableUpdatePayload,
   mapBackendTableToFrontend, mapFrontendTableToCreatePayload, mapFrontendTableToUpdatePayload,
-  mapFrontendStatusToBackend
+  mapFrontendStatusToBackend, cloneTables
 } from "@/lib/floor-plan-utils"
 import { mockAPI } from "@/mocks/mockData"
 
 // Helper constant for minimum size
 const MIN_SIZE = 20;
 
+// Maximum number of undo states to store
+const MAX_UNDO_STATES = 20;
+
+// Append a snapshot to the undo stack, dropping the oldest once the cap is reached
+function pushUndoState(stack: Table[][], state: Table[]): Table[][] {
+  const next = stack.length >= MAX_UNDO_STATES ? stack.slice(stack.length - MAX_UNDO_STATES + 1) : stack.slice();
+  next.push([...state]);
+  return next;
+}
+
 // Throttle utility function
 function throttle<T extends (...args: any[]) => any>(func: T, limit: number): T {
   let inThrottle: boolean;
@@ -91,11 +101,7 @@ export function FloorPlanEditor({ floorPlanId }: FloorPlanEditorProps) {
   const { toast } = useToast()
 
   // Logger
-  const logger = useMemo(() => ({
-      info: (message: string, ...args: any[]) => console.log(`[FloorPlanEditor] ${message}`, ...args),
-      error: (message: string, ...args: any[]) => console.error(`[FloorPlanEditor] ${message}`, ...args),
-      warning: (message: string, ...args: any[]) => console.warn(`[FloorPlanEditor] ${message}`, ...args),
-  }), []);
+  const logger = useMemo(() => createLogger("FloorPlanEditor"), []);
 
   // Create a toast wrapper function that matches our expected call signature
   const showInternalToast = useCallback((message: string, type: 'success' | 'error' | 'warning' | 'default' = 'default') => {
@@ -141,7 +147,7 @@ export function FloorPlanEditor({ floorPlanId }: FloorPlanEditorProps) {
       
       const frontendTables = backendTables.map(mapBackendTableToFrontend);
       setTables(frontendTables);
-      setOriginalTables(JSON.parse(JSON.stringify(frontendTables)));
+      setOriginalTables(cloneTables(frontendTables));
       
       return frontendTables;
     } catch (error: any) {
@@ -445,7 +451,7 @@ export function FloorPlanEditor({ floorPlanId }: FloorPlanEditorProps) {
       setSelectedTable(defaultTable);
       
       // Add to undo stack
-      setUndoStack(prev => [...prev, [...tables]]);
+      setUndoStack(prev => pushUndoState(prev, tables));
       
       // Clear redo stack
       setRedoStack([]);
@@ -478,7 +484,7 @@ export function FloorPlanEditor({ floorPlanId }: FloorPlanEditorProps) {
     
     try {
       // Add current state to undo stack
-      setUndoStack(prev => [...prev, [...tables]]);
+      setUndoStack(prev => pushUndoState(prev, tables));
       
       // Clear redo stack
       setRedoStack([]);
@@ -526,7 +532,7 @@ export function FloorPlanEditor({ floorPlanId }: FloorPlanEditorProps) {
       };
       
       // Add to undo stack
-      setUndoStack(prev => [...prev, [...tables]]);
+      setUndoStack(prev => pushUndoState(prev, tables));
       
       // Clear redo stack
       setRedoStack([]);
@@ -642,7 +648,7 @@ export function FloorPlanEditor({ floorPlanId }: FloorPlanEditorProps) {
       const nextState = newRedoStack.pop();
       
       // Add current state to undo stack
-      setUndoStack(prev => [...prev, currentState]);
+      setUndoStack(prev => pushUndoState(prev, currentState));
       
       // Update redo stack
       setRedoStack(newRedoStack);
@@ -688,7 +694,7 @@ export function FloorPlanEditor({ floorPlanId }: FloorPlanEditorProps) {
       const highestZIndex = Math.max(...tables.map(t => t.zIndex || 0)) + 1;
       
       // Add to undo stack
-      setUndoStack(prev => [...prev, [...tables]]);
+      setUndoStack(prev => pushUndoState(prev, tables));
       
       // Clear redo stack
       setRedoStack([]);
@@ -736,7 +742,7 @@ export function FloorPlanEditor({ floorPlanId }: FloorPlanEditorProps) {
       const lowestZIndex = Math.min(...tables.map(t => t.zIndex || 0)) - 1;
       
       // Add to undo stack
-      setUndoStack(prev => [...prev, [...tables]]);
+      setUndoStack(prev => pushUndoState(prev, tables));
       
       // Clear redo stack
       setRedoStack([]);
@@ -816,8 +822,15 @@ export function FloorPlanEditor({ floorPlanId }: FloorPlanEditorProps) {
         throw new Error(`HTTP error! status: ${response.status}`);
       }
       
-      // Reload tables from API to ensure we have latest data
-      await loadTables();
+      // Use the stored rows when the PUT returns them; otherwise re-fetch so the editor matches the server
+      const savedTables: unknown = await response.json().catch(() => null);
+      if (Array.isArray(savedTables)) {
+        const frontendTables = (savedTables as BackendTable[]).map(mapBackendTableToFrontend);
+        setTables(frontendTables);
+        setOriginalTables(cloneTables(frontendTables));
+      } else {
+        await loadTables();
+      }
       
       toast({
         title: "Success",
@@ -858,19 +871,19 @@ export function FloorPlanEditor({ floorPlanId }: FloorPlanEditorProps) {
       const resizeDir = findResizeHandleAtPosition(x, y);
       if (resizeDir) {
         setIsResizing(true); setResizeDirection(resizeDir); setResizeStart({ x, y });
-        setUndoStack(prev => [...prev, [...tables]]); setRedoStack([]); return;
+        setUndoStack(prev => pushUndoState(prev, tables)); setRedoStack([]); return;
       }
       if (findRotationHandleAtPosition(x, y)) {
         setIsRotating(true); const centerX = selectedTable.x + selectedTable.width / 2, centerY = selectedTable.y + selectedTable.height / 2;
         setRotateStart(Math.atan2(y - centerY, x - centerX)); setInitialRotation(selectedTable.rotation || 0);
-        setUndoStack(prev => [...prev, [...tables]]); setRedoStack([]); return;
+        setUndoStack(prev => pushUndoState(prev, tables)); setRedoStack([]); return;
       }
     }
     const clickedTable = findTableAtPosition(x, y);
     if (clickedTable) {
       if (!selectedTable || selectedTable.id !== clickedTable.id) { setSelectedTable(clickedTable); }
       setIsDragging(true); setDragOffset({ x: x - clickedTable.x, y: y - clickedTable.y });
-      setUndoStack(prev => [...prev, [...tables]]); setRedoStack([]);
+      setUndoStack(prev => pushUndoState(prev, tables)); setRedoStack([]);
       if (navigator.vibrate) navigator.vibrate(50);
     } else if (e.ctrlKey || e.metaKey) {
       setIsPanning(true); setPanStart({ x: e.clientX, y: e.clientY });
@@ -915,7 +928,7 @@ export function FloorPlanEditor({ floorPlanId }: FloorPlanEditorProps) {
         if (e.key === "ArrowLeft") newX -= moveDistance; if (e.key === "ArrowRight") newX += moveDistance;
         if (e.key === "ArrowUp") newY -= moveDistance; if (e.key === "ArrowDown") newY += moveDistance;
         if (snapToGrid && !e.shiftKey) { newX = snapToGridValue(newX); newY = snapToGridValue(newY); }
-        setUndoStack(prev => [...prev, [...tables]]); setRedoStack([]);
+        setUndoStack(prev => pushUndoState(prev, tables)); setRedoStack([]);
         setTables(prev => prev.map(t => t.id === selectedTable.id ? { ...t, x: newX, y: newY } : t));
         setSelectedTable(prev => prev ? { ...prev, x: newX, y: newY } : null);
       }
@@ -976,7 +989,7 @@ export function FloorPlanEditor({ floorPlanId }: FloorPlanEditorProps) {
       
       logger.info("Tables saved successfully");
       setUnsavedChanges(false);
-      setOriginalTables(JSON.parse(JSON.stringify(tablesToSave)));
+      setOriginalTables(cloneTables(tablesToSave));
       showInternalToast("Floor plan saved successfully", "success");
       return true;
     } catch (error: any) {
@@ -989,9 +1002,6 @@ export function FloorPlanEditor({ floorPlanId }: FloorPlanEditorProps) {
     }
   }, [floorPlanId, tables, logger, showInternalToast]);
 
-  // Add MAX_UNDO_STATES constant and undoStack state if they don't exist
-  const MAX_UNDO_STATES = 20; // Maximum number of undo states to store
-
   // Add the handleAddTableToUndoStack function to fix linter errors
   const handleAddTableToUndoStack = useCallback((nextState: Table[]) => {
     if (!nextState) return;
@@ -1,18 +1,31 @@
 import React, { useState, useEffect, useRef, useCallback, useMemo } from "react";
 import { Button } from "@/components/ui/button";
 import { useToast } from "@/hooks/use-toast"; // Corrected import path if needed
-import { Mic, Square, AlertCircle, CheckCircle2, XCircle, Volume2, MicOff, Loader2 } from "lucide-react"; // Added Loader2
-import { Progress } from "@/components/ui/progress";
+import { Mic, Square, AlertCircle, CheckCircle2, XCircle, MicOff, Loader2 } from "lucide-react"; // Added Loader2
 import { motion } from "framer-motion";
-import { mockAPI } from "@/mocks/mockData";
+import { mockAPI, USE_MOCK_TRANSCRIPTION } from "@/mocks/mockData";
+import { createLogger } from "@/lib/utils";
 
 // Constants
 const MAX_RECORDING_TIME = 30000; // 30 seconds
 const MIN_RECORDING_TIME = 1000;  // 1 second
+const TRANSCRIPTION_TIMEOUT = 15000; // 15 seconds
 const AUDIO_VISUALIZER_BARS = 40;
-const IS_SAFARI = typeof window !== 'undefined' && /^((?!chrome|android).)*safari/i.test(navigator.userAgent);
-const OPENAI_API_URL = "https://api.openai.com/v1/audio/transcriptions";
-const OPENAI_MODEL = "whisper-1";
+
+// Dietary alert keywords, compiled once into one case-insensitive pattern per alert
+const DIETARY_ALERT_KEYWORDS: Record<string, string[]> = {
+    'nut allergy': ['nut', 'peanut', 'almond', 'walnut', 'cashew', 'pistachio', 'pecan'],
+    'gluten-free': ['gluten', 'gluten-free', 'wheat'],
+    'dairy-free': ['dairy', 'milk', 'lactose', 'cheese', 'butter', 'cream'],
+    'vegetarian': ['vegetarian', 'no meat'],
+    'vegan': ['vegan', 'no animal', 'plant based', 'plant-based'],
+    'shellfish allergy': ['shellfish', 'shrimp', 'crab', 'lobster', 'clam', 'mussel', 'scallop'],
+    'spicy': ['not spicy', 'mild', 'no spice']
+};
+const DIETARY_ALERT_PATTERNS: [string, RegExp][] = Object.entries(DIETARY_ALERT_KEYWORDS).map(([alert, keywords]) => [
+    alert,
+    new RegExp(keywords.map(keyword => keyword.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')).join('|'), 'i'),
+]);
 
 type VoiceOrderPanelProps = {
   tableId: string;
@@ -44,11 +57,14 @@ export function VoiceOrderPanel({ tableId, tableName, seatNumber, orderType, onO
   const audioStreamRef = useRef<MediaStream | null>(null);
   const mediaRecorderRef = useRef<MediaRecorder | null>(null);
   const analyserRef = useRef<AnalyserNode | null>(null);
+  const sourceNodeRef = useRef<MediaStreamAudioSourceNode | null>(null);
   const visualizerIntervalRef = useRef<number | null>(null);
   const recordingTimeoutRef = useRef<number | null>(null);
   const recordingStartTimeRef = useRef<number>(0);
   const recordingTimerRef = useRef<number | null>(null);
   const audioChunksRef = useRef<Blob[]>([]); // To store audio chunks
+  // Mirrors isProcessing for the recorder's onstop handler, whose closure would only ever see the initial state
+  const processingRef = useRef(false);
 
   // Refs for DOM elements (keep as they are used for UI)
   const voiceButtonRef = useRef<HTMLButtonElement>(null);
@@ -59,11 +75,7 @@ export function VoiceOrderPanel({ tableId, tableName, seatNumber, orderType, onO
   const { toast } = useToast();
 
   // --- Helper Functions ---
-  const logger = useMemo(() => ({
-    info: (message: string, ...args: any[]) => console.log(`[VoiceOrder] ${message}`, ...args),
-    error: (message: string, ...args: any[]) => console.error(`[VoiceOrder] ${message}`, ...args),
-    warning: (message: string, ...args: any[]) => console.warn(`[VoiceOrder] ${message}`, ...args),
-  }), []);
+  const logger = useMemo(() => createLogger("VoiceOrder"), []);
 
   const showInternalToast = useCallback((message: string, type = 'default', duration = 3000) => {
     toast({
@@ -76,25 +88,17 @@ export function VoiceOrderPanel({ tableId, tableName, seatNumber, orderType, onO
 
   // Keep dietary alerts logic
   const checkDietaryAlerts = useCallback((text: string) => {
-    if (!text) return;
-    const alertKeywords = {
-        'nut allergy': ['nut', 'peanut', 'almond', 'walnut', 'cashew', 'pistachio', 'pecan'],
-        'gluten-free': ['gluten', 'gluten-free', 'wheat'],
-        'dairy-free': ['dairy', 'milk', 'lactose', 'cheese', 'butter', 'cream'],
-        'vegetarian': ['vegetarian', 'no meat'],
-        'vegan': ['vegan', 'no animal', 'plant based', 'plant-based'],
-        'shellfish allergy': ['shellfish', 'shrimp', 'crab', 'lobster', 'clam', 'mussel', 'scallop'],
-        'spicy': ['not spicy', 'mild', 'no spice']
-    };
-    setDietaryAlerts([]);
-    const lowerText = text.toLowerCase();
-    const foundAlerts = Object.entries(alertKeywords)
-        .filter(([, keywords]: [string, string[]]) => keywords.some((keyword: string) => lowerText.includes(keyword.toLowerCase()))) // Added types
-        .map(([alert]) => alert);
-    if (foundAlerts.length > 0) setDietaryAlerts(foundAlerts);
+    if (!text || !text.trim()) return;
+    // One pass over the patterns and a single state update
+    const foundAlerts: string[] = [];
+    for (const [alert, pattern] of DIETARY_ALERT_PATTERNS) {
+        if (pattern.test(text)) foundAlerts.push(alert);
+    }
+    setDietaryAlerts(foundAlerts);
   }, []);
 
   const resetUI = useCallback(() => {
+    processingRef.current = false;
     setIsRecording(false); setIsProcessing(false); setTranscription('');
     setShowConfirmation(false); setDietaryAlerts([]);
     if (audioVisualizationRef.current) {
@@ -114,10 +118,16 @@ export function VoiceOrderPanel({ tableId, tableName, seatNumber, orderType, onO
         audioStreamRef.current.getTracks().forEach((track) => track.stop());
         audioStreamRef.current = null; logger.info("Audio stream stopped.");
     }
-    if (audioContextRef.current && audioContextRef.current.state !== 'closed') {
-        try { audioContextRef.current.close(); logger.info("AudioContext closed."); }
-        catch (e: any) { logger.error("Error closing AudioContext:", e); } // Added type
-        finally { audioContextRef.current = null; }
+    // The context outlives the recording, so detach this recording's nodes from it
+    if (sourceNodeRef.current) {
+        sourceNodeRef.current.disconnect();
+        sourceNodeRef.current = null;
+    }
+    // Suspend rather than close so the next recording skips audio graph setup; the context is closed on unmount
+    if (audioContextRef.current && audioContextRef.current.state === 'running') {
+        audioContextRef.current.suspend()
+            .then(() => logger.info("AudioContext suspended."))
+            .catch((e: any) => logger.error("Error suspending AudioContext:", e));
     }
   }, [logger]);
 
@@ -151,11 +161,23 @@ export function VoiceOrderPanel({ tableId, tableName, seatNumber, orderType, onO
 
   // --- Whisper API Call (via Backend Route) ---
   const sendToWhisper = useCallback(async (audioBlob: Blob) => {
+    // The record button is already disabled without a transcription service; never fake a result regardless
+    if (!USE_MOCK_TRANSCRIPTION) {
+      showInternalToast("Voice transcription is not available.", "error");
+      throw new Error("Transcription service is not configured");
+    }
+
+    let timeoutId: number | undefined;
     try {
       logger.info(`Sending audio (${(audioBlob.size / 1024).toFixed(2)} KB) for transcription...`);
       
+      // Give up on a hung transcription so the panel doesn't stay in the processing state
+      const timeout = new Promise<never>((_, reject) => {
+        timeoutId = window.setTimeout(() => reject(new Error("Transcription timed out")), TRANSCRIPTION_TIMEOUT);
+      });
+
       // Use mock API directly instead of making a fetch call
-      const transcriptionResult = await mockAPI.transcribeAudio(audioBlob);
+      const transcriptionResult = await Promise.race([mockAPI.transcribeAudio(audioBlob), timeout]);
       
       logger.info("Mock transcription response:", transcriptionResult);
       
@@ -170,6 +192,8 @@ export function VoiceOrderPanel({ tableId, tableName, seatNumber, orderType, onO
       logger.error("Error in mock transcription:", error);
       showInternalToast("Transcription failed. Could not process audio.", "error");
       throw error;
+    } finally {
+      window.clearTimeout(timeoutId);
     }
   }, [logger, showInternalToast]);
 
@@ -256,7 +280,7 @@ export function VoiceOrderPanel({ tableId, tableName, seatNumber, orderType, onO
     if (recordingTimeoutRef.current) window.clearTimeout(recordingTimeoutRef.current); recordingTimeoutRef.current = null;
     if (recordingTimerRef.current) window.clearInterval(recordingTimerRef.current); recordingTimerRef.current = null;
 
-    const recordingTime = Date.now() - recordingStartTimeRef.current;
+    const recordingTime = performance.now() - recordingStartTimeRef.current;
     logger.info(`Recording stopped after ${recordingTime}ms`);
 
     // Stop the recorder - this triggers the 'onstop' event where we process the blob
@@ -284,6 +308,7 @@ export function VoiceOrderPanel({ tableId, tableName, seatNumber, orderType, onO
     }
 
     // Set processing state *after* minimum time check
+    processingRef.current = true;
     setIsProcessing(true);
     showInternalToast("Processing audio...", "default", 5000); // Inform user
 
@@ -313,12 +338,13 @@ export function VoiceOrderPanel({ tableId, tableName, seatNumber, orderType, onO
         if (!audioContextRef.current || audioContextRef.current.state === 'closed') {
             audioContextRef.current = new (window.AudioContext || (window as any).webkitAudioContext)({ sampleRate: 44100, latencyHint: 'interactive' });
         }
-        if (IS_SAFARI && audioContextRef.current.state === 'suspended') await audioContextRef.current.resume();
+        // A context kept from the previous recording may be suspended, or still suspending, so always resume it
+        await audioContextRef.current.resume();
 
-        const source = audioContextRef.current.createMediaStreamSource(audioStreamRef.current);
+        sourceNodeRef.current = audioContextRef.current.createMediaStreamSource(audioStreamRef.current);
         analyserRef.current = audioContextRef.current.createAnalyser();
         analyserRef.current.fftSize = 256;
-        source.connect(analyserRef.current);
+        sourceNodeRef.current.connect(analyserRef.current);
 
         // Determine preferred MIME type, fallback to webm or wav
         let mimeType = "audio/webm;codecs=opus";
@@ -362,7 +388,7 @@ export function VoiceOrderPanel({ tableId, tableName, seatNumber, orderType, onO
 
             // Send to Whisper API only if processing state is still true
             // (handles cases where user cancels quickly or min time wasn't met)
-            if (isProcessing) {
+            if (processingRef.current) {
                 try {
                     const transcriptText = await sendToWhisper(audioBlob);
                     if (transcriptText) {
@@ -384,10 +410,9 @@ export function VoiceOrderPanel({ tableId, tableName, seatNumber, orderType, onO
                     // Optionally reset transcription display here if needed
                     // setTranscription("Error during transcription.");
                 } finally {
-                    // Always ensure processing is false after attempt, unless an error requires manual reset
-                    if (isProcessing) { // Check again in case error handling changed it
-                       setIsProcessing(false);
-                    }
+                    // Always ensure processing is false after attempt
+                    processingRef.current = false;
+                    setIsProcessing(false);
                 }
             } else {
                  logger.info("Processing was cancelled before API call.");
@@ -402,8 +427,10 @@ export function VoiceOrderPanel({ tableId, tableName, seatNumber, orderType, onO
             resetRecording();
         };
 
-        mediaRecorderRef.current.start(1000); // Collect chunks every second (adjust if needed)
-        setIsRecording(true); recordingStartTimeRef.current = Date.now();
+        // No timeslice: the whole recording is delivered as one chunk when stop() is called,
+        // since it is only transcribed once recording ends
+        mediaRecorderRef.current.start();
+        setIsRecording(true); recordingStartTimeRef.current = performance.now();
         startVisualization();
 
         setRecordingDuration(0);
@@ -437,6 +464,7 @@ export function VoiceOrderPanel({ tableId, tableName, seatNumber, orderType, onO
   // Effect to check permission on mount and handle changes
   useEffect(() => {
     let isMounted = true;
+    let permissionStatus: PermissionStatus | null = null;
 
     const checkPermission = async () => {
         if (typeof navigator.permissions?.query !== 'function') {
@@ -450,18 +478,18 @@ export function VoiceOrderPanel({ tableId, tableName, seatNumber, orderType, onO
         }
 
         try {
-            const permissionStatus = await navigator.permissions.query({ name: 'microphone' as PermissionName }); // Cast needed for older TS versions
-            if (isMounted) {
-                setMicPermission(permissionStatus.state);
-                setShowPermissionError(permissionStatus.state === 'denied');
-            }
+            const status = await navigator.permissions.query({ name: 'microphone' as PermissionName }); // Cast needed for older TS versions
+            if (!isMounted) return;
+            permissionStatus = status;
+            setMicPermission(status.state);
+            setShowPermissionError(status.state === 'denied');
 
-            permissionStatus.onchange = () => {
+            status.onchange = () => {
                 if (isMounted) {
-                    logger.info(`Microphone permission state changed to: ${permissionStatus.state}`);
-                    setMicPermission(permissionStatus.state);
-                    setShowPermissionError(permissionStatus.state === 'denied');
-                    if (permissionStatus.state === 'denied' && isRecording) {
+                    logger.info(`Microphone permission state changed to: ${status.state}`);
+                    setMicPermission(status.state);
+                    setShowPermissionError(status.state === 'denied');
+                    if (status.state === 'denied' && isRecording) {
                         showInternalToast("Microphone access revoked.", "error");
                         resetRecording(); // Stop recording if permission revoked mid-session
                     }
@@ -481,8 +509,14 @@ export function VoiceOrderPanel({ tableId, tableName, seatNumber, orderType, onO
 
     return () => {
         isMounted = false;
+        // Detach the permission listener so it doesn't outlive the component
+        if (permissionStatus) permissionStatus.onchange = null;
         // Cleanup: Stop recording and streams if component unmounts
         resetRecording();
+        if (audioContextRef.current && audioContextRef.current.state !== 'closed') {
+            audioContextRef.current.close().catch((e: any) => logger.error("Error closing AudioContext:", e));
+        }
+        audioContextRef.current = null;
         logger.info("VoiceOrderPanel unmounted, cleaning up.");
     };
     // Run only on mount and unmount
@@ -525,6 +559,7 @@ export function VoiceOrderPanel({ tableId, tableName, seatNumber, orderType, onO
   // --- Rendering Logic ---
 
   const transcriptionDisplayText = useMemo(() => {
+    if (!USE_MOCK_TRANSCRIPTION) return "Voice ordering is not available.";
     if (isProcessing) return "Processing...";
     if (isRecording) return "Listening...";
     if (showConfirmation && transcription) return transcription;
@@ -550,8 +585,8 @@ export function VoiceOrderPanel({ tableId, tableName, seatNumber, orderType, onO
   };
 
   const isButtonDisabled = useMemo(() => {
-      // Disable if processing, or if permission is denied/error *after* initial check
-      return isProcessing || (micPermission !== null && micPermission !== 'granted' && micPermission !== 'prompt');
+      // Disable if there is no transcription service, if processing, or if permission is denied/error *after* initial check
+      return !USE_MOCK_TRANSCRIPTION || isProcessing || (micPermission !== null && micPermission !== 'granted' && micPermission !== 'prompt');
   }, [isProcessing, micPermission]);
 
 
@@ -0,0 +1,66 @@
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import { TTLCache, TTLValue } from './cache';
+
+describe('TTLCache', () => {
+
+    afterEach(() => {
+        vi.useRealTimers();
+    });
+
+    it('should return stored values until they expire', () => {
+        vi.useFakeTimers();
+        const cache = new TTLCache<string, number>(10, 1000);
+
+        cache.set('a', 1);
+        expect(cache.get('a')).toBe(1);
+
+        vi.advanceTimersByTime(1001);
+        expect(cache.get('a')).toBeUndefined();
+        expect(cache.size).toBe(0);
+    });
+
+    it('should evict the least recently used entry when full', () => {
+        const cache = new TTLCache<string, number>(2, 60000);
+
+        cache.set('a', 1);
+        cache.set('b', 2);
+        cache.get('a'); // 'b' is now the least recently used
+        cache.set('c', 3);
+
+        expect(cache.get('a')).toBe(1);
+        expect(cache.get('b')).toBeUndefined();
+        expect(cache.get('c')).toBe(3);
+        expect(cache.size).toBe(2);
+    });
+
+    it('should drop entries on delete and clear', () => {
+        const cache = new TTLCache<string, number>(10, 60000);
+
+        cache.set('a', 1);
+        cache.set('b', 2);
+        cache.delete('a');
+        expect(cache.get('a')).toBeUndefined();
+
+        cache.clear();
+        expect(cache.size).toBe(0);
+    });
+});
+
+describe('TTLValue', () => {
+
+    afterEach(() => {
+        vi.useRealTimers();
+    });
+
+    it('should return the stored value until it expires', () => {
+        vi.useFakeTimers();
+        const value = new TTLValue<number[]>(1000);
+
+        expect(value.get()).toBeUndefined();
+        value.set([1, 2]);
+        expect(value.get()).toEqual([1, 2]);
+
+        vi.advanceTimersByTime(1001);
+        expect(value.get()).toBeUndefined();
+    });
+});
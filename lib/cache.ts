@@ -0,0 +1,70 @@
+// Reference data (residents, the table layout, seat ids) is set up before service and read
+// on every server page load, so serving it up to a minute stale is acceptable
+export const REFERENCE_DATA_TTL = 60 * 1000 // 1 minute
+
+// Small in-memory cache with a size cap and a per-entry time-to-live.
+// Map keeps insertion order, so re-inserting an entry on read marks it as most recently
+// used and the first key is always the least recently used one to evict.
+export class TTLCache<K, V> {
+  private entries = new Map<K, { value: V; expiresAt: number }>()
+
+  constructor(private readonly maxSize: number, private readonly ttlMs: number) {}
+
+  get(key: K): V | undefined {
+    const entry = this.entries.get(key)
+    if (!entry) return undefined
+
+    if (entry.expiresAt <= Date.now()) {
+      this.entries.delete(key)
+      return undefined
+    }
+
+    this.entries.delete(key)
+    this.entries.set(key, entry)
+    return entry.value
+  }
+
+  set(key: K, value: V): void {
+    this.entries.delete(key)
+    this.entries.set(key, { value, expiresAt: Date.now() + this.ttlMs })
+
+    if (this.entries.size > this.maxSize) {
+      const oldest = this.entries.keys().next()
+      if (!oldest.done) this.entries.delete(oldest.value)
+    }
+  }
+
+  delete(key: K): void {
+    this.entries.delete(key)
+  }
+
+  clear(): void {
+    this.entries.clear()
+  }
+
+  get size(): number {
+    return this.entries.size
+  }
+}
+
+// Holds a single value for ttlMs, for caching one whole result such as a full list
+export class TTLValue<V> {
+  private entry: { value: V; expiresAt: number } | null = null
+
+  constructor(private readonly ttlMs: number) {}
+
+  get(): V | undefined {
+    if (!this.entry) return undefined
+
+    if (this.entry.expiresAt <= Date.now()) {
+      this.entry = null
+      return undefined
+    }
+
+    return this.entry.value
+  }
+
+  set(value: V): void {
+    this.entry = { value, expiresAt: Date.now() + this.ttlMs }
+  }
+}
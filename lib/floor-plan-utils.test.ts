@@ -5,7 +5,8 @@ import {
     BackendTable,
     mapBackendTableToFrontend,
     mapFrontendTableToCreatePayload,
-    mapFrontendTableToUpdatePayload
+    mapFrontendTableToUpdatePayload,
+    cloneTables
 } from './floor-plan-utils';
 
 describe('Floor Plan Utils - Mapping Functions', () => {
@@ -108,4 +109,18 @@ describe('Floor Plan Utils - Mapping Functions', () => {
         expect(updatePayload?.position_y).toBe(70);
     });
 
-});
\ No newline at end of file
+    // --- cloneTables ---
+    it('should copy tables without sharing row objects', () => {
+        const tables: Table[] = [
+            { id: 'backend-1', type: 'circle', x: 50, y: 50, width: 100, height: 100, seats: 4, label: 'T1', status: 'available', rotation: 0 }
+        ];
+
+        const copy = cloneTables(tables);
+        expect(copy).toEqual(tables);
+        expect(copy[0]).not.toBe(tables[0]);
+
+        copy[0].x = 80;
+        expect(tables[0].x).toBe(50);
+    });
+
+});
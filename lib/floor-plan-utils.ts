@@ -98,6 +98,10 @@ export const mapBackendTableToFrontend = (backendTable: BackendTable): Table =>
   };
 };
 
+// Helper function to snapshot tables (e.g. as the last-saved state)
+// Table only holds primitives, so copying each row is a full copy without a JSON round-trip
+export const cloneTables = (tables: Table[]): Table[] => tables.map(table => ({ ...table }));
+
 // Helper function to map frontend table to backend CREATE payload
 export const mapFrontendTableToCreatePayload = (table: Table, floorPlanId: string): TableCreatePayload => ({
     name: table.label,
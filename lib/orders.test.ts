@@ -0,0 +1,22 @@
+import { describe, it, expect, vi } from 'vitest';
+
+// The Supabase client is created at import time and needs env settings; splitOrderItems never queries
+vi.mock('./supabase/client', () => ({ supabase: {} }));
+
+import { splitOrderItems } from './orders';
+
+describe('splitOrderItems', () => {
+    it('trims whitespace around each item', () => {
+        expect(splitOrderItems('  soup ,salad,  iced tea  ')).toEqual(['soup', 'salad', 'iced tea']);
+    });
+
+    it('skips empty pieces', () => {
+        expect(splitOrderItems('soup,, ,salad,')).toEqual(['soup', 'salad']);
+    });
+
+    it('returns an empty list when nothing but separators and whitespace is given', () => {
+        expect(splitOrderItems('')).toEqual([]);
+        expect(splitOrderItems('   ')).toEqual([]);
+        expect(splitOrderItems(' , ,, ')).toEqual([]);
+    });
+});
@@ -1,5 +1,16 @@
 import { supabase } from './supabase/client';
 
+export type OrderStatus = 'new' | 'in_progress' | 'ready' | 'delivered';
+export type OrderType = 'food' | 'drink';
+
+// Display labels for each status, so views don't reformat the status string for every order
+export const ORDER_STATUS_LABELS: Record<OrderStatus, string> = {
+  new: 'New',
+  in_progress: 'In progress',
+  ready: 'Ready',
+  delivered: 'Delivered',
+};
+
 interface OrderRow {
   id: string;
   table_id: string;
@@ -8,8 +19,8 @@ interface OrderRow {
   server_id: string;
   items: string[];
   transcript: string;
-  status: 'new' | 'in_progress' | 'ready' | 'delivered';
-  type: 'food' | 'drink';
+  status: OrderStatus;
+  type: OrderType;
   created_at: string;
   tables: {
     label: number;
@@ -24,14 +35,38 @@ export interface Order extends OrderRow {
   seat: number;
 }
 
+/**
+ * Split a comma-separated order into trimmed, non-empty items in a single pass
+ */
+export function splitOrderItems(orderText: string): string[] {
+  const items: string[] = [];
+  for (const piece of orderText.split(',')) {
+    const item = piece.trim();
+    if (item) items.push(item);
+  }
+  return items;
+}
+
+// Shared select with the table/seat labels joined in, built once rather than per query.
+// Columns are listed explicitly so new columns on orders aren't shipped to every view
+const ORDER_SELECT =
+  'id, table_id, seat_id, resident_id, server_id, items, transcript, status, type, created_at, tables!inner(label), seats!inner(label)';
+
+// Bumped by every write through this module so caches of derived data (order suggestions)
+// can include it in their keys and never serve results from before the write
+let ordersGeneration = 0;
+
+/**
+ * Current orders generation; changes whenever an order is created or updated through this module
+ */
+export function getOrdersGeneration(): number {
+  return ordersGeneration;
+}
+
 export async function fetchRecentOrders(limit = 5): Promise<Order[]> {
   const { data, error } = await supabase
     .from('orders')
-    .select(`
-      *,
-      tables!inner(label),
-      seats!inner(label)
-    `)
+    .select(ORDER_SELECT)
     .order('created_at', { ascending: false })
     .limit(limit);
 
@@ -55,7 +90,7 @@ export async function createOrder(orderData: {
   server_id: string;
   items: string[];
   transcript: string;
-  type: 'food' | 'drink';
+  type: OrderType;
 }): Promise<Order> {
   const { data, error } = await supabase
     .from('orders')
@@ -65,11 +100,7 @@ export async function createOrder(orderData: {
         status: 'new'
       }
     ])
-    .select(`
-      *,
-      tables!inner(label),
-      seats!inner(label)
-    `)
+    .select(ORDER_SELECT)
     .single();
 
   if (error) {
@@ -77,6 +108,8 @@ export async function createOrder(orderData: {
     throw error;
   }
 
+  ordersGeneration++;
+
   return {
     ...data,
     table: `Table ${data.tables.label}`,
@@ -85,7 +118,7 @@ export async function createOrder(orderData: {
   } as Order;
 }
 
-export async function updateOrderStatus(orderId: string, status: OrderRow['status']): Promise<void> {
+export async function updateOrderStatus(orderId: string, status: OrderStatus): Promise<void> {
   const { error } = await supabase
     .from('orders')
     .update({ status })
@@ -95,4 +128,6 @@ export async function updateOrderStatus(orderId: string, status: OrderRow['statu
     console.error('Error updating order status:', error);
     throw error;
   }
+
+  ordersGeneration++;
 }
\ No newline at end of file
@@ -1,9 +1,21 @@
 import { supabase } from "@/lib/supabase/client";
+import { REFERENCE_DATA_TTL, TTLCache } from "@/lib/cache";
+
+// Resolved seat ids by table and label. Seats are deleted with their table, so entries expire
+// and a re-provisioned seat's new id is picked up instead of failing order inserts until reload
+const SEAT_ID_CACHE_SIZE = 500;
+const seatIdCache = new TTLCache<string, string>(SEAT_ID_CACHE_SIZE, REFERENCE_DATA_TTL);
 
 /**
  * Fetch a seat ID based on table and seat label
  */
 export async function fetchSeatId(tableId: string, seatLabel: number): Promise<string | null> {
+  const cacheKey = `${tableId}:${seatLabel}`;
+  const cachedId = seatIdCache.get(cacheKey);
+  if (cachedId) {
+    return cachedId;
+  }
+
   const seatData = await supabase
     .from('seats')
     .select('id')
@@ -16,6 +28,7 @@ export async function fetchSeatId(tableId: string, seatLabel: number): Promise<s
     return null;
   }
 
+  seatIdCache.set(cacheKey, seatData.data.id);
   return seatData.data.id;
 }
 
@@ -1,4 +1,6 @@
-import { createClient } from '@supabase/supabase-js'
+import { supabase } from './supabase/client'
+import { getOrdersGeneration, type OrderType } from './orders'
+import { TTLCache } from './cache'
 
 // Type definitions
 type OrderSuggestion = {
@@ -6,6 +8,18 @@ type OrderSuggestion = {
   frequency: number
 }
 
+// Only the most recent orders are scanned, so memory and transfer stay bounded
+// no matter how long a resident's history grows
+const SUGGESTION_HISTORY_LIMIT = 200
+
+// Suggestions are recomputed at most every 30 seconds per (resident, type, limit), and
+// only the most recently used combinations are kept. The orders generation is part of the
+// key, so a newly placed order is reflected straight away
+const suggestionsCache = new TTLCache<string, OrderSuggestion[]>(100, 30 * 1000)
+
+// Lookups already in progress, so concurrent misses for the same key share one query
+const pendingSuggestions = new Map<string, Promise<OrderSuggestion[]>>()
+
 /**
  * Get order suggestions for a user based on their order history
  * @param userId - The ID of the user to get suggestions for
@@ -15,15 +29,38 @@ type OrderSuggestion = {
  */
 export async function getOrderSuggestions(
   userId: string,
-  orderType: string,
+  orderType: OrderType,
   limit: number = 5
 ): Promise<OrderSuggestion[]> {
-  // Initialize Supabase client
-  const supabase = createClient(
-    process.env.NEXT_PUBLIC_SUPABASE_URL!,
-    process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!
-  )
+  const cacheKey = [getOrdersGeneration(), userId, orderType, limit].join('|')
+  const cached = suggestionsCache.get(cacheKey)
+  if (cached) {
+    return cached
+  }
+
+  const pending = pendingSuggestions.get(cacheKey)
+  if (pending) {
+    return pending
+  }
 
+  const request = computeOrderSuggestions(userId, orderType, limit)
+    .then(suggestions => {
+      suggestionsCache.set(cacheKey, suggestions)
+      return suggestions
+    })
+    .finally(() => {
+      pendingSuggestions.delete(cacheKey)
+    })
+
+  pendingSuggestions.set(cacheKey, request)
+  return request
+}
+
+async function computeOrderSuggestions(
+  userId: string,
+  orderType: OrderType,
+  limit: number
+): Promise<OrderSuggestion[]> {
   // Fetch user's order history
   const { data: orders, error } = await supabase
     .from('orders')
@@ -31,6 +68,7 @@ export async function getOrderSuggestions(
     .eq('resident_id', userId)
     .eq('type', orderType)
     .order('created_at', { ascending: false })
+    .limit(SUGGESTION_HISTORY_LIMIT)
 
   if (error) {
     throw new Error(`Failed to fetch order history: ${error.message}`)
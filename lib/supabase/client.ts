@@ -1,6 +1,4 @@
 import { createClient } from '@supabase/supabase-js'
-
-const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL!
-const supabaseAnonKey = process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!
+import { supabaseUrl, supabaseAnonKey } from './config'
 
 export const supabase = createClient(supabaseUrl, supabaseAnonKey)
\ No newline at end of file
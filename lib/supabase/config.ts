@@ -0,0 +1,3 @@
+// Supabase connection settings, read from the environment in one place
+export const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL!
+export const supabaseAnonKey = process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!
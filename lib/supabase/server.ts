@@ -1,12 +1,13 @@
 import { createClient as createSupabaseClient } from '@supabase/supabase-js'
 import { cookies } from 'next/headers'
+import { supabaseUrl, supabaseAnonKey } from './config'
 
 export async function createClient() {
   const cookieStore = await cookies()
   
   return createSupabaseClient(
-    process.env.NEXT_PUBLIC_SUPABASE_URL!,
-    process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
+    supabaseUrl,
+    supabaseAnonKey,
     {
       global: {
         fetch: fetch.bind(globalThis)
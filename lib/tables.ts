@@ -1,5 +1,6 @@
 import { supabase } from './supabase/client';
 import { Table } from './floor-plan-utils';
+import { REFERENCE_DATA_TTL, TTLValue } from './cache';
 
 interface SupabaseTable {
   id: string;
@@ -40,16 +41,29 @@ const GRID_CONFIG = {
   tablesPerRow: 3
 };
 
+const tablesCache = new TTLValue<Table[]>(REFERENCE_DATA_TTL);
+
+/**
+ * Fetch all tables with their seat counts, laid out on a grid.
+ * Results are cached for REFERENCE_DATA_TTL, so table status can be up to a minute old;
+ * the server view only uses the layout and seat counts.
+ */
 export async function fetchTables(): Promise<Table[]> {
+  const cached = tablesCache.get();
+  if (cached) {
+    return cached;
+  }
+
   // Fetch tables and their seats in parallel
   const [tablesResponse, seatsResponse] = await Promise.all([
     supabase
       .from('tables')
-      .select('*')
+      .select('id, label, type, status')
       .order('label'),
+    // Only table_id is needed to count seats per table
     supabase
       .from('seats')
-      .select('*')
+      .select('table_id')
   ]);
 
   if (tablesResponse.error) {
@@ -63,7 +77,7 @@ export async function fetchTables(): Promise<Table[]> {
   }
 
   const tables = tablesResponse.data as SupabaseTable[];
-  const seats = seatsResponse.data as SupabaseSeat[];
+  const seats = seatsResponse.data as Pick<SupabaseSeat, 'table_id'>[];
 
   // Create a map of table_id to seat count
   const seatCountMap = seats.reduce((acc, seat) => {
@@ -72,7 +86,7 @@ export async function fetchTables(): Promise<Table[]> {
   }, {} as Record<string, number>);
 
   // Transform tables to match mock data format with grid layout
-  return tables.map((table, index): Table => {
+  const data = tables.map((table, index): Table => {
     const defaults = table.type === 'circle' ? CIRCLE_TABLE_DEFAULTS : RECTANGLE_TABLE_DEFAULTS;
     
     // Calculate grid position
@@ -97,4 +111,7 @@ export async function fetchTables(): Promise<Table[]> {
       ...defaults
     };
   });
-} 
\ No newline at end of file
+
+  tablesCache.set(data);
+  return data;
+}
@@ -1,4 +1,5 @@
 import { supabase } from './supabase/client'
+import { REFERENCE_DATA_TTL, TTLValue } from './cache'
 
 // Type definitions
 export type User = {
@@ -6,11 +7,18 @@ export type User = {
   name: string
 }
 
+const residentsCache = new TTLValue<User[]>(REFERENCE_DATA_TTL)
+
 /**
  * Fetches all users with the 'resident' role from the database
  * @returns Array of residents
  */
 export async function getAllResidents(): Promise<User[]> {
+  const cached = residentsCache.get()
+  if (cached) {
+    return cached
+  }
+
   // Get all residents from profiles
   const { data: residents, error } = await supabase
     .from('profiles')
@@ -26,8 +34,11 @@ export async function getAllResidents(): Promise<User[]> {
   }
 
   // Transform the data into the expected format
-  return residents.map(resident => ({
+  const data = residents.map(resident => ({
     id: resident.user_id,
     name: resident.name,
   }))
+
+  residentsCache.set(data)
+  return data
 } 
\ No newline at end of file
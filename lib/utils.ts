@@ -4,3 +4,17 @@ import { twMerge } from "tailwind-merge"
 export function cn(...inputs: ClassValue[]) {
   return twMerge(clsx(inputs))
 }
+
+// Info-level logs are only emitted in development; errors and warnings always are
+const LOG_INFO = process.env.NODE_ENV !== "production"
+
+/**
+ * Create a console logger that prefixes every message with `[scope]`
+ */
+export function createLogger(scope: string) {
+  return {
+    info: (message: string, ...args: any[]) => { if (LOG_INFO) console.log(`[${scope}] ${message}`, ...args) },
+    error: (message: string, ...args: any[]) => console.error(`[${scope}] ${message}`, ...args),
+    warning: (message: string, ...args: any[]) => console.warn(`[${scope}] ${message}`, ...args),
+  }
+}
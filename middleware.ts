@@ -1,6 +1,10 @@
 import { createClient } from '@supabase/supabase-js'
 import { NextResponse } from 'next/server'
 import type { NextRequest } from 'next/server'
+import { supabaseUrl, supabaseAnonKey } from '@/lib/supabase/config'
+
+// Public routes that don't require authentication (built once at module load)
+const PUBLIC_ROUTES: readonly string[] = ['/', '/login', '/signup', '/auth/callback']
 
 export async function middleware(request: NextRequest) {
   let response = NextResponse.next({
@@ -9,9 +13,22 @@ export async function middleware(request: NextRequest) {
     },
   })
 
+  // Route checks come first so public and API requests skip the Supabase client
+  // and session round trip entirely
+  const pathname = request.nextUrl.pathname
+
+  if (PUBLIC_ROUTES.some(route => pathname.startsWith(route))) {
+    return response
+  }
+
+  // API routes are handled separately
+  if (pathname.startsWith('/api/')) {
+    return response
+  }
+
   const supabase = createClient(
-    process.env.NEXT_PUBLIC_SUPABASE_URL!,
-    process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
+    supabaseUrl,
+    supabaseAnonKey,
     {
       global: {
         fetch: fetch.bind(globalThis)
@@ -37,19 +54,6 @@ export async function middleware(request: NextRequest) {
     })
   }
 
-  // Public routes that don't require authentication
-  const publicRoutes = ['/', '/login', '/signup', '/auth/callback']
-  const pathname = request.nextUrl.pathname
-  
-  if (publicRoutes.some(route => pathname.startsWith(route))) {
-    return response
-  }
-
-  // API routes are handled separately
-  if (pathname.startsWith('/api/')) {
-    return response
-  }
-
   // Check authentication for all other routes
   const { data: { user } } = await supabase.auth.getUser()
   if (!user) {
@@ -157,29 +157,29 @@ export const generateOrderId = () => {
   return `ord-${String(orderIdCounter++).padStart(3, '0')}`;
 };
 
+// Predefined responses for mock voice transcription
+const MOCK_TRANSCRIPTIONS = [
+  "I'd like the grilled salmon with a side salad, please.",
+  "Can I get a cheeseburger medium rare with fries?",
+  "I'll have the chicken alfredo pasta and a water, thank you.",
+  "I would like the veggie pizza with extra mushrooms.",
+  "Could I get the steak, medium, with mashed potatoes and asparagus?",
+  "Just a coffee, black, and the chocolate cake for dessert."
+];
+
 // Mock response for voice transcription
 export const mockTranscription = (audioBlob: Blob) => {
-  // Generate a semi-random response based on audio blob size
-  const size = audioBlob.size;
-  
-  // Predefined responses based on different audio blob sizes
-  const responses = [
-    "I'd like the grilled salmon with a side salad, please.",
-    "Can I get a cheeseburger medium rare with fries?",
-    "I'll have the chicken alfredo pasta and a water, thank you.",
-    "I would like the veggie pizza with extra mushrooms.",
-    "Could I get the steak, medium, with mashed potatoes and asparagus?",
-    "Just a coffee, black, and the chocolate cake for dessert."
-  ];
-  
   // Use audio size modulo to select a response, adding some variety
-  const responseIndex = Math.abs(size % responses.length);
+  const responseIndex = Math.abs(audioBlob.size % MOCK_TRANSCRIPTIONS.length);
   
   return {
-    text: responses[responseIndex]
+    text: MOCK_TRANSCRIPTIONS[responseIndex]
   };
 };
 
+// Canned transcriptions are only for local development; production must not report made-up orders as success
+export const USE_MOCK_TRANSCRIPTION = process.env.NODE_ENV !== "production";
+
 // Mock API functions that simulate backend behavior
 export const mockAPI = {
   // Get tables for a floor plan
@@ -9,6 +9,17 @@ const nextConfig = {
   images: {
     unoptimized: true,
   },
+  async headers() {
+    return [
+      // Let browsers reuse static images between page loads; Next's ETags cover revalidation
+      {
+        source: '/images/:path*',
+        headers: [
+          { key: 'Cache-Control', value: 'public, max-age=3600, stale-while-revalidate=86400' },
+        ],
+      },
+    ]
+  },
   // Proxy API requests to the backend during development
   async rewrites() {
     const API_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000'
@@ -21,9 +21,17 @@ let printerConfig: PrinterConfig = {
 let isPrinterConnected = false
 
 // Add caching for printer status to reduce redundant operations
-let lastConnectionAttempt = 0
+// Timed with performance.now() so wall-clock changes can't extend or skip the cache window
+let lastConnectionAttempt = -Infinity
 const CONNECTION_CACHE_TIME = 30000 // 30 seconds
 
+// Failed connections are held for the normal cache window, doubling with each further failure,
+// plus up to 20% jitter so clients don't retry in lockstep. Never shorter than CONNECTION_CACHE_TIME
+const RECONNECT_BACKOFF_MAX = 5 * 60 * 1000 // 5 minutes
+const RECONNECT_JITTER = 0.2
+let failedConnectionAttempts = 0
+let connectionCacheWindow = CONNECTION_CACHE_TIME
+
 // Initialize printer connection
 export const initializePrinter = async (config?: Partial<PrinterConfig>): Promise<boolean> => {
   try {
@@ -32,10 +40,10 @@ export const initializePrinter = async (config?: Partial<PrinterConfig>): Promis
       printerConfig = { ...printerConfig, ...config }
     }
 
-    const now = Date.now()
+    const now = performance.now()
 
     // Use cached result if recent
-    if (now - lastConnectionAttempt < CONNECTION_CACHE_TIME) {
+    if (now - lastConnectionAttempt < connectionCacheWindow) {
       console.log("Using cached printer connection status:", isPrinterConnected)
       return isPrinterConnected
     }
@@ -47,6 +55,15 @@ export const initializePrinter = async (config?: Partial<PrinterConfig>): Promis
     isPrinterConnected = Math.random() < 0.8
     lastConnectionAttempt = now
 
+    if (isPrinterConnected) {
+      failedConnectionAttempts = 0
+      connectionCacheWindow = CONNECTION_CACHE_TIME
+    } else {
+      failedConnectionAttempts++
+      const backoff = Math.min(RECONNECT_BACKOFF_MAX, CONNECTION_CACHE_TIME * 2 ** (failedConnectionAttempts - 1))
+      connectionCacheWindow = backoff * (1 + Math.random() * RECONNECT_JITTER)
+    }
+
     return isPrinterConnected
   } catch (error) {
     console.error("Error initializing printer:", error)
@@ -0,0 +1,13 @@
+-- Composite indexes matching the filter combinations used by the app
+
+-- Order suggestions: where resident_id = ? and type = ? order by created_at desc
+create index if not exists orders_resident_type_created_idx
+  on public.orders(resident_id, type, created_at desc);
+
+-- Seat lookup: where table_id = ? and label = ?
+create index if not exists seats_table_label_idx
+  on public.seats(table_id, label);
+
+-- Each composite index leads with the column of a single-column index, so those only add write cost
+drop index if exists public.orders_resident_id_idx;
+drop index if exists public.seats_table_id_idx;
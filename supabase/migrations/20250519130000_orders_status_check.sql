@@ -0,0 +1,9 @@
+-- Let the database reject invalid order states so status updates stay a single UPDATE
+-- with no read-and-validate step beforehand. Values mirror the OrderStatus and OrderType types in lib/orders.ts.
+alter table public.orders
+  add constraint orders_status_check
+  check (status in ('new', 'in_progress', 'ready', 'delivered'));
+
+alter table public.orders
+  add constraint orders_type_check
+  check (type in ('food', 'drink'));